@@ -0,0 +1,69 @@
+"""Pull CSV/JSON files out of uploaded archives in /mnt/data into ./data/, then bake the cleaned dataset to Parquet."""
+import os
+import shutil
+import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from flight_dash.data import DATA_PATH, bake_parquet
+
+SOURCE_DIR = "/mnt/data"
+OUT_DIR = "data"
+EXTENSIONS = (".csv", ".json")
+# Buffer size for copying archive members; larger chunks mean fewer read/write calls.
+COPY_CHUNK = 1 << 20
+
+def file_crc32(path):
+    """CRC-32 of a file, read in COPY_CHUNK blocks."""
+    crc = 0
+    with open(path, "rb") as f:
+        while chunk := f.read(COPY_CHUNK):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+def is_current(target, info):
+    """True if target already holds this member: same size, then same CRC (the zip stores both)."""
+    return os.path.exists(target) and os.path.getsize(target) == info.file_size and file_crc32(target) == info.CRC
+
+def extract_zip(path, out_dir):
+    """Extract the CSV/JSON members of one archive in parallel, skipping unchanged ones; return the written paths."""
+    with zipfile.ZipFile(path) as zf:
+        # One member per target (later duplicates win, as with a serial copy).
+        members = {os.path.join(out_dir, os.path.basename(info.filename)): info
+                   for info in zf.infolist() if info.filename.lower().endswith(EXTENSIONS)}
+        def extract_one(item):
+            target, info = item
+            if is_current(target, info):
+                return None
+            with zf.open(info) as src, open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst, COPY_CHUNK)
+            return target
+        # zlib releases the GIL while inflating, so threads overlap decompression and disk I/O.
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            return [t for t in pool.map(extract_one, members.items()) if t is not None]
+
+def extract(source_dir=SOURCE_DIR, out_dir=OUT_DIR):
+    """Copy CSV/JSON files (loose or inside zip archives) from source_dir into out_dir; return the written paths."""
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    if not os.path.isdir(source_dir):
+        return written
+    # DirEntry.is_file() reuses the type from the directory listing instead of a stat per entry.
+    with os.scandir(source_dir) as it:
+        candidates = sorted((e for e in it if e.is_file()), key=lambda e: e.name)
+    for entry in candidates:
+        if zipfile.is_zipfile(entry.path):
+            written.extend(extract_zip(entry.path, out_dir))
+        elif entry.name.lower().endswith(EXTENSIONS):
+            target = os.path.join(out_dir, entry.name)
+            shutil.copyfile(entry.path, target)
+            written.append(target)
+    return written
+
+if __name__ == "__main__":
+    for path in extract():
+        print(f"extracted {path}")
+    if os.path.exists(DATA_PATH):
+        print(f"wrote {bake_parquet(DATA_PATH)}")
+    else:
+        print(f"No {DATA_PATH} found; export the dataset as CSV and rerun.")
@@ -0,0 +1 @@
+"""Flight Crash Dashboard: data loading, aggregation and tab rendering for app.py."""
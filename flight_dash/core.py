@@ -0,0 +1,403 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import plotly.express as px
+import plotly.graph_objects as go
+import os
+import io
+import base64
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from textwrap import dedent
+
+from flight_dash.data import DATA_PATH, STRING_COLUMNS, clean_data, parquet_path
+
+
+GEOCODE_CACHE = "data/geocoded_locations.parquet"
+# Legacy CSV cache; read only while no Parquet cache has been written.
+GEOCODE_CACHE_CSV = "data/geocoded_locations.csv"
+# Lower edge of each fatality range after "0" (searchsorted bucket boundaries).
+FATAL_EDGES = np.array([1,6,11,21,51,101], dtype="int32")
+# Above this many points the map is rasterized with Datashader instead of one marker per accident.
+DATASHADER_MIN_POINTS = 5000
+# Rows sent to the Data Explorer table; the full selection is offered as a CSV download.
+EXPLORER_MAX_ROWS = 500
+# Selections whose mask/frame/CSV stay cached; each filtered frame is a full copy, so keep this bounded.
+SELECTION_CACHE_ENTRIES = 16
+FATAL_LABELS = ["0","1-5","6-10","11-20","21-50","51-100","100+"]
+
+def file_mtime(path):
+    """Modification time of path (None if missing); used as a cache key."""
+    return os.path.getmtime(path) if os.path.exists(path) else None
+@st.cache_data(show_spinner=False)
+def load_data(path=DATA_PATH, mtime=None, geo_mtime=None):
+    """Load the cleaned dataset (baked Parquet if fresh, else the CSV) and geocode-merge it; cached on mtimes."""
+    pq = parquet_path(path)
+    pq_mtime, csv_mtime = file_mtime(pq), file_mtime(path)
+    if pq_mtime is not None and (csv_mtime is None or pq_mtime >= csv_mtime):
+        df = pd.read_parquet(pq, engine="pyarrow")
+        # Parquet restores categories as plain str; put them back on Arrow strings like clean_data.
+        for c in STRING_COLUMNS:
+            if c in df.columns:
+                df[c] = df[c].cat.rename_categories(df[c].cat.categories.astype("string[pyarrow]"))
+    else:
+        df = clean_data(path)
+    return ensure_geocoded(df)
+def read_geocode_cache():
+    """Return the on-disk geocode cache (location, latitude, longitude), or None if absent."""
+    if os.path.exists(GEOCODE_CACHE):
+        geo = pd.read_parquet(GEOCODE_CACHE)
+    elif os.path.exists(GEOCODE_CACHE_CSV):
+        geo = pd.read_csv(GEOCODE_CACHE_CSV)
+    else:
+        return None
+    geo.columns = geo.columns.str.strip().str.lower()
+    return geo
+def ensure_geocoded(df):
+    """Return df with latitude/longitude if available or from cache."""
+    if "latitude" in df.columns and "longitude" in df.columns:
+        return df
+    geo = read_geocode_cache()
+    # merge on location; a shared categorical key lets pandas join on integer codes
+    if geo is not None and "location" in df.columns and "location" in geo.columns:
+        if isinstance(df["location"].dtype, pd.CategoricalDtype):
+            geo = geo[geo["location"].isin(df["location"].cat.categories)].astype({"location": df["location"].dtype})
+        df = df.merge(geo, on="location", how="left")
+    return df
+def geocode_locations(locations, provider="nominatim", user_agent="flight-crash-dashboard", max_workers=4, min_delay_seconds=1):
+    """Geocode with geopy Nominatim on a thread pool (returns dict of location -> coords).
+
+    Workers overlap network latency while sharing one rate limit: requests start at
+    least min_delay_seconds apart across all threads (Nominatim's public server asks
+    for <= 1 req/s; lower it only for your own instance)."""
+    try:
+        from geopy.geocoders import Nominatim
+    except Exception as e:
+        st.error("geopy not installed. Add geopy to requirements to enable geocoding.")
+        return {}
+    geolocator = Nominatim(user_agent=user_agent, timeout=10)
+    lock = threading.Lock()
+    next_start = [time.monotonic()]
+    def geocode(loc):
+        if pd.isna(loc) or loc == "":
+            return loc, {"latitude": None, "longitude": None}
+        with lock:
+            start = max(next_start[0], time.monotonic())
+            next_start[0] = start + min_delay_seconds
+        time.sleep(max(0, start - time.monotonic()))
+        try:
+            g = geolocator.geocode(loc)
+        except Exception:
+            g = None
+        if g:
+            return loc, {"latitude": g.latitude, "longitude": g.longitude}
+        return loc, {"latitude": None, "longitude": None}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(pool.map(geocode, locations))
+def year_bar_figure(counts):
+    """Accidents-by-year bar built from typed NumPy arrays (base64 transport)."""
+    fig = go.Figure(go.Bar(x=counts["year"].to_numpy(dtype="int16"), y=counts["accidents"].to_numpy(dtype="int32"),
+                           hovertemplate="year=%{x}<br>Number of Accidents=%{y}<extra></extra>"))
+    fig.update_layout(title="Accidents by Year", xaxis=dict(title="year", dtick=1), yaxis=dict(title="Number of Accidents"))
+    return fig
+def damage_colors(levels):
+    """Fixed colour per damage level (by category position), shared by the markers and the raster."""
+    palette = px.colors.qualitative.Plotly
+    return {level: palette[i % len(palette)] for i, level in enumerate(levels.cat.categories)}
+def accident_map_figure(df_plot):
+    """One Scattermap trace per damage level, lat/lon passed as float32 arrays."""
+    colors = damage_colors(df_plot["damage_level"])
+    fig = go.Figure()
+    for level, grp in df_plot.groupby("damage_level", observed=True, sort=False):
+        fig.add_trace(go.Scattermap(
+            lat=grp["latitude"].to_numpy(dtype="float32"), lon=grp["longitude"].to_numpy(dtype="float32"),
+            mode="markers", name=str(level), marker=dict(color=colors[level]), hovertext=grp["operator"].astype(str).to_numpy(),
+            customdata=np.column_stack([grp["date"].astype(str), grp["aircraft_type"].astype(str), grp["fatalities"]]),
+            hovertemplate="<b>%{hovertext}</b><br><br>damage_level=" + str(level)
+                          + "<br>date=%{customdata[0]}<br>aircraft_type=%{customdata[1]}<br>fatalities=%{customdata[2]}<extra></extra>"))
+    fig.update_layout(map=dict(style="open-street-map", zoom=1,
+                                  center=dict(lat=float(df_plot["latitude"].mean()), lon=float(df_plot["longitude"].mean()))),
+                      height=600, legend_title_text="damage_level", margin=dict(t=60))
+    return fig
+def meters_to_lnglat(x, y):
+    """Inverse of datashader.utils.lnglat_to_meters (spherical Web Mercator)."""
+    r = 6378137.0
+    return np.degrees(np.asarray(x) / r), np.degrees(2 * np.arctan(np.exp(np.asarray(y) / r)) - np.pi / 2)
+def datashaded_map_figure(df_plot, hover_points=500):
+    """Rasterize all points into a map image layer; only the deadliest accidents stay hoverable markers.
+
+    Points are projected to Web Mercator before aggregation, since the map
+    stretches the image linearly in that projection between its corners.
+    Returns None when datashader is not installed."""
+    try:
+        import datashader as ds
+        import datashader.transfer_functions as tf
+        from datashader.utils import lnglat_to_meters
+    except Exception:
+        return None
+    # Web Mercator is undefined at the poles; clamp to the range web maps draw.
+    x, y = lnglat_to_meters(df_plot["longitude"].to_numpy(dtype="float64"),
+                            df_plot["latitude"].to_numpy(dtype="float64").clip(-85.05, 85.05))
+    pts = pd.DataFrame({"x": x, "y": y, "damage_level": df_plot["damage_level"].array})
+    # pad so a single location still gives a non-empty extent
+    x_range = (x.min() - 1000, x.max() + 1000)
+    y_range = (y.min() - 1000, y.max() + 1000)
+    cvs = ds.Canvas(plot_width=900, plot_height=600, x_range=x_range, y_range=y_range)
+    agg = cvs.points(pts, "x", "y", ds.count_cat("damage_level"))
+    img = tf.shade(agg, color_key=damage_colors(df_plot["damage_level"]))
+    buf = io.BytesIO()
+    img.to_pil().save(buf, format="PNG")
+    (west, east), (south, north) = meters_to_lnglat(x_range, y_range)
+    fig = accident_map_figure(df_plot.nlargest(hover_points, "fatalities"))
+    fig.update_layout(map_layers=[{
+        "sourcetype": "image",
+        "source": "data:image/png;base64," + base64.b64encode(buf.getvalue()).decode(),
+        "coordinates": [[west, north], [east, north], [east, south], [west, south]],
+    }])
+    return fig
+def top_categories(s, n, count_name):
+    """Top-n categories of s by row count as a two-column frame (zero counts dropped).
+
+    Counts come from np.bincount over the category codes and only the top n are
+    ordered (argpartition), so the full distribution is never sorted."""
+    codes = s.cat.codes.to_numpy()
+    counts = np.bincount(codes[codes >= 0], minlength=len(s.cat.categories))
+    k = min(n, np.count_nonzero(counts))
+    idx = np.argpartition(-counts, k - 1)[:k] if k else np.empty(0, dtype=np.intp)
+    idx = idx[np.argsort(-counts[idx], kind="stable")]
+    return pd.DataFrame({s.name: s.cat.categories[idx], count_name: counts[idx]})
+def year_damage_aggregates(df):
+    """dmg_year, counts and dmg_counts from one 2-D histogram of (year, damage code).
+
+    np.bincount over flattened year-offset * n_levels + code indices is a single
+    pass with no hashing; an extra last row collects the undated accidents so
+    dmg_counts still covers every row."""
+    years = df["year"].to_numpy(dtype="int16", na_value=-1).astype(np.intp)
+    dated = years >= 0
+    lo = years[dated].min() if dated.any() else 0
+    n_years = years[dated].max() - lo + 1 if dated.any() else 0
+    dmg = df["damage_level"]
+    codes, n_levels = dmg.cat.codes.to_numpy(), len(dmg.cat.categories)
+    rows = np.where(dated, years - lo, n_years)[codes >= 0]
+    hist = np.bincount(rows * n_levels + codes[codes >= 0], minlength=(n_years + 1) * n_levels).reshape(n_years + 1, n_levels)
+    y, d = np.nonzero(hist[:n_years])
+    dmg_year = pd.DataFrame({"year": (y + lo).astype("int16"), "damage_level": pd.Categorical.from_codes(d, dtype=dmg.dtype), "accidents": hist[y, d]})
+    per_year = hist[:n_years].sum(axis=1)
+    years_seen = np.flatnonzero(per_year)
+    per_level = hist.sum(axis=0)
+    order = np.argsort(-per_level, kind="stable")
+    order = order[per_level[order] > 0]
+    return {
+        "dmg_year": dmg_year,
+        "counts": pd.DataFrame({"year": (years_seen + lo).astype("int16"), "accidents": per_year[years_seen]}),
+        "dmg_counts": pd.DataFrame({"damage_level": pd.Categorical.from_codes(order, dtype=dmg.dtype), "count": per_level[order]}),
+    }
+@st.cache_data(show_spinner=False)
+def filter_options(data_key):
+    """Sidebar option lists; categories are already sorted, so no per-rerun unique/sort."""
+    df = load_data(*data_key)
+    years = sorted(df["year"].dropna().unique().tolist())
+    return years, df["damage_level"].cat.categories.tolist(), df["operator"].cat.categories[:50].tolist()
+def category_mask(s, selected):
+    """Boolean mask of s in selected, matched on categorical codes; None if all are selected."""
+    codes = np.flatnonzero(s.cat.categories.isin(selected))
+    if len(codes) == len(s.cat.categories):
+        return None
+    return np.isin(s.cat.codes.to_numpy(), codes)
+def filter_mask(df, years, damage, operators):
+    """Combined boolean mask for the sidebar selections, or None when nothing filters."""
+    # year is Int16: compare the raw int16 values (missing years -> -1, never selected)
+    masks = [np.isin(df["year"].to_numpy(dtype="int16", na_value=-1), np.asarray(years, dtype="int16"))] if years else []
+    # the sidebar preselects every year; an all-True mask would only force a copy
+    if masks and masks[0].all():
+        masks = []
+    for col, selected in (("damage_level", damage), ("operator", operators)):
+        m = category_mask(df[col], selected) if selected else None
+        if m is not None:
+            masks.append(m)
+    return np.logical_and.reduce(masks) if masks else None
+def selection_key(years, damage, operators):
+    """Hashable, order-independent cache key for the sidebar selections."""
+    return tuple(sorted(years)), tuple(sorted(damage)), tuple(sorted(operators))
+# cache_resource hands back the stored object itself (no unpickled copy per rerun);
+# callers treat it as read-only.
+@st.cache_resource(show_spinner=False, max_entries=SELECTION_CACHE_ENTRIES)
+def selection_mask(data_key, years, damage, operators):
+    """Boolean row mask for one selection (None when nothing filters), shared by the frame and the aggregates."""
+    return filter_mask(load_data(*data_key), years, damage, operators)
+@st.cache_resource(show_spinner=False, max_entries=SELECTION_CACHE_ENTRIES)
+def filtered_data(data_key, years, damage, operators):
+    """The filtered frame for one selection; read-only, and the full dataset itself when nothing filters."""
+    df = load_data(*data_key)
+    mask = selection_mask(data_key, years, damage, operators)
+    return df if mask is None else df.loc[mask]
+@st.cache_data(show_spinner=False, max_entries=SELECTION_CACHE_ENTRIES)
+def explorer_view(data_key, years, damage, operators):
+    """The newest EXPLORER_MAX_ROWS filtered rows, so reruns skip sorting the whole selection."""
+    filtered = filtered_data(data_key, years, damage, operators)
+    return filtered.sort_values("date", ascending=False).head(EXPLORER_MAX_ROWS).reset_index(drop=True)
+@st.cache_data(show_spinner=False, max_entries=SELECTION_CACHE_ENTRIES)
+def filtered_csv(data_key, years, damage, operators):
+    """CSV bytes of the filtered frame for the explorer's download button."""
+    return filtered_data(data_key, years, damage, operators).to_csv(index=False).encode()
+@st.cache_data(show_spinner=False)
+def load_table(data_key):
+    """Arrow copy of the cached dataset; categoricals become dictionary arrays."""
+    return pa.Table.from_pandas(load_data(*data_key), preserve_index=False)
+def arrow_aggregates(table):
+    """Operator and aircraft aggregates: two Arrow hash aggregations, marginals rolled up from them."""
+    od = table.group_by(["operator","damage_level"]).aggregate([([], "count_all"), ("fatalities", "sum")]).to_pandas()
+    air = table.group_by("aircraft_type").aggregate([([], "count_all"), ("fatalities", "mean")]).to_pandas()
+    air = air.rename(columns={"count_all": "accidents", "fatalities_mean": "avg_fatalities"})
+    aggs = {}
+    od = od.dropna(subset=["operator"])
+    aggs["pivot"] = od.pivot(index="operator", columns="damage_level", values="count_all").fillna(0).astype("int64").sort_index()
+    ops_fat = od.groupby("operator", observed=True, sort=False, as_index=False)["fatalities_sum"].sum()
+    aggs["ops_fat"] = ops_fat.rename(columns={"fatalities_sum": "fatalities"}).nlargest(15, "fatalities")
+    aggs["avg_fat"] = air.nlargest(10, "avg_fatalities", keep="first")[["aircraft_type","avg_fatalities"]]
+    aggs["aw"] = air.dropna(subset=["aircraft_type"]).nlargest(20, "accidents", keep="first").reset_index(drop=True)
+    return aggs
+@st.cache_data(show_spinner=False, max_entries=SELECTION_CACHE_ENTRIES)
+def compute_aggregates(data_key, years, damage, operators):
+    """Every tab's small frames for one filter combination, from the cached mask and filtered frame."""
+    mask = selection_mask(data_key, years, damage, operators)
+    filtered = filtered_data(data_key, years, damage, operators)
+    table = load_table(data_key)
+    if mask is not None:
+        table = table.filter(pa.array(mask))
+    aggs = arrow_aggregates(table)
+    aggs.update(year_damage_aggregates(filtered))
+    aggs["top_ops"] = top_categories(filtered["operator"], 15, "accidents")
+    aggs["top_air"] = top_categories(filtered["aircraft_type"], 10, "accidents")
+    aggs["loc_counts"] = top_categories(filtered["location"], 20, "count")
+    fatal_idx = np.searchsorted(FATAL_EDGES, filtered["fatalities"].to_numpy(), side="right")
+    aggs["fr_counts"] = pd.DataFrame({"fatal_range": FATAL_LABELS, "count": np.bincount(fatal_idx, minlength=len(FATAL_LABELS))})
+    aggs["top_fatal"] = filtered.nlargest(10, "fatalities", keep="first")[["date","operator","aircraft_type","fatalities","location"]]
+    return aggs
+def dataset_key():
+    """(path, newest data mtime, geocode mtime) cache key for the dataset; stops the app if no data file exists."""
+    mtimes = [m for m in (file_mtime(DATA_PATH), file_mtime(parquet_path(DATA_PATH))) if m is not None]
+    if not mtimes:
+        st.error(f"Dataset not found at {DATA_PATH}. Please add the CSV there.")
+        st.stop()
+    return (DATA_PATH, max(mtimes), file_mtime(GEOCODE_CACHE) or file_mtime(GEOCODE_CACHE_CSV))
+def render_filters(data_key):
+    """Sidebar filters; returns the (years, damage levels, operators) selections."""
+    with st.sidebar:
+        st.header("Filters")
+        year_opts, damage_opts, operator_opts = filter_options(data_key)
+        years = st.multiselect("Year(s)", year_opts, default=year_opts)
+        damage_sel = st.multiselect("Damage Level(s)", damage_opts, default=damage_opts)
+        operator_sel = st.multiselect("Operator(s) (top 50 shown)", operator_opts)
+    return years, damage_sel, operator_sel
+def render_overview(filtered, aggs):
+    """Overview tab: KPIs, yearly/damage/operator charts."""
+    st.subheader("Accident Overview")
+    k1, k2, k3, k4 = st.columns(4)
+    k1.metric("Total Accidents", f"{len(filtered):,}")
+    k2.metric("Total Fatalities", f"{int(filtered['fatalities'].sum()):,}")
+    k3.metric("Total Unique Operators", f"{filtered['operator'].nunique():,}")
+    k4.metric("Max Fatalities in Single Accident", f"{int(filtered['fatalities'].max()) if len(filtered)>0 else 0:,}")
+    st.markdown("---")
+    st.markdown("#### Accidents Over Time")
+    fig_year = year_bar_figure(aggs["counts"])
+    st.plotly_chart(fig_year, use_container_width=True)
+    col1, col2 = st.columns([1,2])
+    with col1:
+        st.markdown("#### Damage Level Distribution")
+        fig_pie = px.pie(aggs["dmg_counts"], names="damage_level", values="count", title="Damage Level Distribution")
+        st.plotly_chart(fig_pie, use_container_width=True)
+    with col2:
+        st.markdown("#### Number of Accidents by Operator (Top 15)")
+        fig_ops = px.bar(aggs["top_ops"], x="accidents", y="operator", orientation="h", title="Top Operators by Accident Count")
+        st.plotly_chart(fig_ops, use_container_width=True)
+    st.markdown("---")
+    c1, c2 = st.columns(2)
+    with c1:
+        st.markdown("#### Average Fatalities Reported (by aircraft type)")
+        fig_avg = px.bar(aggs["avg_fat"], x="avg_fatalities", y="aircraft_type", orientation="h", title="Top 10 Aircraft Types by Avg Fatalities")
+        st.plotly_chart(fig_avg, use_container_width=True)
+    with c2:
+        st.markdown("#### Year-wise Breakdown of Damage Levels")
+        fig_dy = px.bar(aggs["dmg_year"], x="year", y="accidents", color="damage_level", barmode="group", title="Damage Level by Year")
+        st.plotly_chart(fig_dy, use_container_width=True)
+def render_analysis(aggs):
+    """Fatality & Damage tab: fatality ranges, deadliest accidents, operator x damage."""
+    st.subheader("Fatality & Damage Analysis")
+    st.markdown("#### Number of Accidents by Fatality Ranges")
+    fig_fr = px.bar(aggs["fr_counts"], x="fatal_range", y="count", title="Accidents by Fatality Ranges")
+    st.plotly_chart(fig_fr, use_container_width=True)
+    st.markdown("---")
+    st.markdown("#### Top 10 Highest Fatality Accidents")
+    st.dataframe(aggs["top_fatal"].reset_index(drop=True), use_container_width=True)
+    st.markdown("---")
+    st.markdown("#### Operator vs Damage Level (Counts)")
+    pivot = aggs["pivot"]
+    if pivot.shape[0] <= 50:
+        fig_heat = px.imshow(pivot, labels=dict(x="Damage Level", y="Operator", color="Count"),
+                             x=pivot.columns, y=pivot.index, aspect="auto", title="Operator vs Damage Level (counts)")
+        st.plotly_chart(fig_heat, use_container_width=True)
+    else:
+        st.dataframe(pivot.nlargest(50, pivot.columns.tolist(), keep="first"))
+def render_insights(aggs):
+    """Aircraft & Operator tab."""
+    st.subheader("Aircraft & Operator Insights")
+    st.markdown("#### Top 10 Aircraft Types Involved in Accidents")
+    fig_air = px.bar(aggs["top_air"], x="accidents", y="aircraft_type", orientation="h", title="Top 10 Aircraft Types")
+    st.plotly_chart(fig_air, use_container_width=True)
+    st.markdown("---")
+    st.markdown("#### Operators Responsible for Most Fatalities")
+    fig_ops_fat = px.bar(aggs["ops_fat"], x="fatalities", y="operator", orientation="h", title="Operators by Total Fatalities")
+    st.plotly_chart(fig_ops_fat, use_container_width=True)
+    st.markdown("---")
+    st.markdown("#### Aircraft-wise Summary: Count & Avg Fatalities")
+    st.dataframe(aggs["aw"], use_container_width=True)
+def render_map(filtered, aggs):
+    """Map tab: accident map (or the geocoding prompt) and top locations."""
+    st.subheader("Geographic Locations of Accidents")
+    if "latitude" not in filtered.columns or "longitude" not in filtered.columns or filtered["latitude"].isna().all():
+        st.info(dedent("""
+            No latitude/longitude columns detected for locations.  
+            You can geocode unique 'location' values using OpenStreetMap (Nominatim) from the app.
+            **Note:** Geocoding may take time and respects rate limits. Results are cached in `data/geocoded_locations.parquet`.
+        """))
+        if st.button("🛰️ Geocode unique locations now"):
+            cached = read_geocode_cache()
+            known = set(cached["location"]) if cached is not None else set()
+            unique_locs = [loc for loc in filtered["location"].dropna().unique().tolist() if loc not in known]
+            with st.spinner(f"Geocoding {len(unique_locs)} unique locations (may take a while)..."):
+                results = geocode_locations(unique_locs)
+            cache_rows = []
+            for loc, coords in results.items():
+                cache_rows.append({"location": loc, "latitude": coords.get("latitude"), "longitude": coords.get("longitude")})
+            cache_df = pd.DataFrame(cache_rows, columns=["location","latitude","longitude"])
+            os.makedirs("data", exist_ok=True)
+            merged = pd.concat([cached, cache_df], ignore_index=True) if cached is not None else cache_df
+            merged.astype({"location": "str", "latitude": "float32", "longitude": "float32"}).to_parquet(GEOCODE_CACHE, index=False, compression="zstd")
+            st.success(f"Geocoding finished — added {len(cache_df)} rows to {GEOCODE_CACHE}. Reload the app to plot the map.")
+    else:
+        df_plot = filtered.dropna(subset=["latitude","longitude"])
+        if len(df_plot) == 0:
+            st.warning("Latitude/longitude exist but all rows are empty.")
+        else:
+            fig_map = datashaded_map_figure(df_plot) if len(df_plot) > DATASHADER_MIN_POINTS else None
+            if fig_map is not None:
+                st.markdown(f"#### Accident Map (density colored by damage level, {len(df_plot):,} points)")
+            else:
+                st.markdown("#### Accident Map (markers colored by damage level)")
+                fig_map = accident_map_figure(df_plot)
+            st.plotly_chart(fig_map, use_container_width=True)
+    st.markdown("---")
+    st.markdown("#### Top Accident Locations (by count)")
+    st.dataframe(aggs["loc_counts"], use_container_width=True)
+def render_explorer(filtered, view, csv):
+    """Data Explorer tab: the newest filtered rows (view), plus the full selection as CSV.
+
+    csv is a callable returning the CSV bytes; the download button only calls it on click."""
+    st.subheader("Data Explorer")
+    st.markdown("Filter results and inspect raw data below.")
+    st.write(f"Showing {len(view):,} of {len(filtered):,} rows (after filters), newest first.")
+    st.dataframe(view, use_container_width=True)
+    st.download_button("Download filtered CSV", csv, file_name="flight_crash_filtered.csv", mime="text/csv")
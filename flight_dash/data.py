@@ -0,0 +1,54 @@
+"""Raw CSV -> cleaned frame for the dashboard, and the Parquet bake of it; no Streamlit imports."""
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+
+DATA_PATH = "data/flight_crash_data.csv"
+# Arrow-backed strings speed up the value_counts/groupby hot paths; numeric
+# columns stay on NumPy, where pandas' groupby kernels are fastest. They are
+# then stored as categoricals so groupby/filters work on small integer codes.
+STRING_COLUMNS = ("operator", "location", "aircraft_type", "damage_level")
+# Raw CSV header -> Arrow type for the text columns, so the reader never infers them.
+CSV_COLUMN_TYPES = {c: pa.string() for c in ("date", "type", "aircraft_type", "reg", "operator", "location", "damage_level")}
+# pandas' default NA strings, so empty/"N/A" text cells come back null as they did with pd.read_csv.
+CSV_NULL_VALUES = ["", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+                   "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"]
+# Date formats tried in order (the export uses dd-mm-yyyy); values matching none stay NaT.
+DATE_FORMATS = ("%d-%m-%Y", "%Y-%m-%d", "%d/%m/%Y")
+
+def parquet_path(path):
+    """Cleaned Parquet copy of the CSV at path (written by extract_data.py; loaded while at least as new as the CSV)."""
+    return os.path.splitext(path)[0] + ".parquet"
+def clean_data(path=DATA_PATH):
+    """Parse the raw CSV and normalize column names and dtypes (no geocoding)."""
+    convert = pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES, null_values=CSV_NULL_VALUES, strings_can_be_null=True)
+    df = pacsv.read_csv(path, convert_options=convert).to_pandas()
+    df.columns = df.columns.str.strip().str.lower()
+    if "type" in df.columns:
+        df = df.rename(columns={"type": "aircraft_type"})
+    dates = pd.to_datetime(df["date"], format=DATE_FORMATS[0], errors="coerce")
+    for fmt in DATE_FORMATS[1:]:
+        if not (dates.isna() & df["date"].notna()).any():
+            break
+        dates = dates.combine_first(pd.to_datetime(df["date"], format=fmt, errors="coerce"))
+    df["date"] = dates
+    df["year"] = df["date"].dt.year.astype("Int16")
+    if "damage_level" in df.columns:
+        df["damage_level"] = df["damage_level"].astype(str).str.capitalize().fillna("Unknown")
+    else:
+        df["damage_level"] = "Unknown"
+    df["operator"] = df.get("operator", pd.Series("Unknown")).fillna("Unknown")
+    df["fatalities"] = pd.to_numeric(df.get("fatalities", 0), errors="coerce").fillna(0).astype("int32")
+    df = df.astype({c: "string[pyarrow]" for c in STRING_COLUMNS if c in df.columns})
+    for c in STRING_COLUMNS:
+        if c in df.columns:
+            df[c] = df[c].astype("category")
+    return df
+def bake_parquet(path=DATA_PATH):
+    """Write the cleaned dataset to parquet_path(path) so cold starts skip CSV parsing."""
+    out = parquet_path(path)
+    clean_data(path).to_parquet(out, engine="pyarrow", compression="snappy", index=False)
+    return out